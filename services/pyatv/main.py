@@ -7,34 +7,113 @@ and provides full remote control functionality including D-pad navigation,
 transport controls, and now playing information.
 
 Usage:
-    uvicorn main:app --host 0.0.0.0 --port 8000
+    uvicorn main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools \
+        --no-access-log --timeout-keep-alive 75
 
 Environment Variables:
-    APPLETV_SCAN_TIMEOUT: Timeout for scanning Apple TVs (default: 5 seconds)
+    APPLETV_SCAN_TIMEOUT: Timeout for scanning Apple TVs (default: 2 seconds)
     APPLETV_PAIR_PIN: Default PIN for pairing (prompted during first run)
 """
 
 import asyncio
+import hashlib
 import logging
+import os
+import time
+from collections import OrderedDict, defaultdict
 from typing import Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from starlette.convertors import Convertor, register_url_convertor
+import orjson
 import pyatv
 from pyatv.const import Protocol, DeviceState, FeatureName, FeatureState
+from pyatv.interface import DeviceListener, PushListener
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Cache for discovered Apple TVs and active connections
-discovered_devices: dict[str, pyatv.interface.BaseConfig] = {}
-active_connections: dict[str, pyatv.interface.AppleTV] = {}
+# Cache for discovered Apple TVs, oldest first by when a scan last saw them
+discovered_devices: OrderedDict[str, pyatv.interface.BaseConfig] = OrderedDict()
 
-# Lock for connection management
-connection_lock = asyncio.Lock()
+# Active connections, least recently used first
+active_connections: OrderedDict[str, pyatv.interface.AppleTV] = OrderedDict()
+
+# Size limits for the caches above; the oldest entries are evicted first, except
+# devices that are connected or being connected to
+MAX_DISCOVERED_DEVICES = 64
+MAX_CONNECTIONS = 16
+
+# Remote control commands, each named after its pyatv RemoteControl method
+COMMAND_NAMES = frozenset({
+    # Navigation
+    "up", "down", "left", "right", "select", "menu", "home", "top_menu",
+    # Playback
+    "play", "pause", "play_pause", "stop", "next", "previous",
+    "skip_forward", "skip_backward",
+    # Volume
+    "volume_up", "volume_down",
+})
+
+# Features that are fixed for the lifetime of a connection. FeatureName.App is
+# left out: it is only available while something is playing.
+CACHED_FEATURES = (FeatureName.LaunchApp, FeatureName.AppList)
+
+# Timeout for discovering all devices; most home LANs answer mDNS in well under
+# a second. Scans for a single known device return as soon as it answers.
+SCAN_TIMEOUT = float(os.getenv("APPLETV_SCAN_TIMEOUT", "2.0"))
+
+# How long scan results are trusted before a device is re-validated
+SCAN_CACHE_TTL = 300.0
+
+# Timeout for the TCP reachability check of a cached device
+VALIDATE_TIMEOUT = 0.1
+
+# Scan cache expiry time (monotonic), and in-flight scans shared by all callers,
+# keyed by target identifier (None for a full scan)
+scan_cache_expiry: float = 0.0
+scan_tasks: dict[Optional[str], asyncio.Task] = {}
+
+# How often connections are probed, when they are proactively recycled, and how
+# long an unused connection is kept before it is closed
+KEEPALIVE_INTERVAL = 30.0
+CONNECTION_MAX_AGE = 600.0
+CONNECTION_IDLE_TIMEOUT = 1800.0
+
+# How long a replaced connection stays open so commands already running on it
+# can finish
+RECYCLE_GRACE_PERIOD = 5.0
+
+# When each active connection was established and last used (monotonic)
+connected_at: dict[str, float] = {}
+last_used: dict[str, float] = {}
+
+# WebSocket subscribers to now playing push updates, per device
+now_playing_subscribers: dict[str, set[WebSocket]] = {}
+
+# Last now playing state pushed by each subscribed device
+now_playing_cache: dict[str, "NowPlayingInfo"] = {}
+
+# Active push listeners (pyatv only keeps a weak reference to them)
+push_listeners: dict[str, "NowPlayingListener"] = {}
+
+# Fire-and-forget tasks, referenced until done so they aren't garbage collected
+background_tasks: set[asyncio.Task] = set()
+
+# In-flight connection attempts, awaited by concurrent callers for the same device
+pending_connections: dict[str, asyncio.Task] = {}
+
+# Per-device locks for connection management (guard the dicts above, never held
+# across I/O). Creating a lock never awaits, so the defaultdict needs no guard,
+# and since no critical section awaits, a lock can be dropped at any time.
+device_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Upper bound on waiting for a connection to tear down
+CLOSE_TIMEOUT = 2.0
 
 
 class DeviceInfo(BaseModel):
@@ -74,87 +153,419 @@ class PairingRequest(BaseModel):
     pin: str
 
 
-async def scan_apple_tvs(timeout: float = 5.0) -> list[pyatv.interface.BaseConfig]:
-    """Scan the network for Apple TV devices"""
-    logger.info(f"Scanning for Apple TVs (timeout: {timeout}s)...")
-    devices = await pyatv.scan(asyncio.get_event_loop(), timeout=timeout)
-    logger.info(f"Found {len(devices)} Apple TV(s)")
+class CommandResult(BaseModel):
+    """Result of a remote control command"""
+    success: bool
+    command: str
+
+
+class AppLaunchResult(BaseModel):
+    """Result of launching an app"""
+    success: bool
+    app_id: str
+
+
+class AppInfo(BaseModel):
+    """An app installed on the Apple TV"""
+    id: str
+    name: Optional[str] = None
+
+
+class AppList(BaseModel):
+    """Apps installed on the Apple TV"""
+    apps: list[AppInfo]
+    message: Optional[str] = None
+
+
+class ConnectResult(BaseModel):
+    """Result of connecting to an Apple TV"""
+    success: bool
+    device_id: str
+    name: str
+
+
+class DisconnectResult(BaseModel):
+    """Result of disconnecting from an Apple TV"""
+    success: bool
+    message: str
+
+
+class HealthStatus(BaseModel):
+    """Service health and cache sizes"""
+    status: str
+    discovered_devices: int
+    active_connections: int
+
+
+class ConnectionListener(DeviceListener):
+    """Flags a connection as closed as soon as pyatv reports it lost or closed"""
+    
+    def __init__(self, device_id: str, atv: pyatv.interface.AppleTV):
+        self.device_id = device_id
+        self.atv = atv
+    
+    def connection_lost(self, exception: Exception) -> None:
+        logger.warning("Lost connection to %s: %s", self.device_id, exception)
+        self.atv._is_closed = True
+    
+    def connection_closed(self) -> None:
+        self.atv._is_closed = True
+
+
+async def scan_apple_tvs(
+    timeout: float = SCAN_TIMEOUT, identifier: Optional[str] = None
+) -> list[pyatv.interface.BaseConfig]:
+    """
+    Scan the network for Apple TV devices, joining an identical scan already running
+
+    With an identifier, the scan stops as soon as that device is found.
+    """
+    # The scan runs in its own task so a cancelled caller can't abort a scan
+    # other callers share
+    pending = scan_tasks.get(identifier)
+    if pending is None:
+        pending = scan_tasks[identifier] = spawn(run_scan(timeout, identifier))
+        # Mark any failure as retrieved; every caller may have gone away
+        pending.add_done_callback(lambda task: task.cancelled() or task.exception())
+    
+    # Shield so a cancelled caller doesn't cancel the scan for everyone else
+    return await asyncio.shield(pending)
+
+
+async def run_scan(
+    timeout: float, identifier: Optional[str]
+) -> list[pyatv.interface.BaseConfig]:
+    """Run one scan and merge its results into the cache (runs as a shared task)"""
+    global scan_cache_expiry
+    
+    try:
+        logger.info("Scanning for Apple TVs (timeout: %ss)...", timeout)
+        devices = await pyatv.scan(
+            asyncio.get_running_loop(), timeout=timeout, identifier=identifier
+        )
+        logger.info("Found %s Apple TV(s)", len(devices))
+    finally:
+        scan_tasks.pop(identifier, None)
+    
+    # Merge rather than replace: devices missing from this scan are kept
+    # and validated before use
+    for device in devices:
+        discovered_devices[device.identifier] = device
+        discovered_devices.move_to_end(device.identifier)
+    excess = len(discovered_devices) - MAX_DISCOVERED_DEVICES
+    if excess > 0:
+        evictable = [
+            device_id for device_id in discovered_devices
+            if device_id not in active_connections and device_id not in pending_connections
+        ]
+        for device_id in evictable[:excess]:
+            del discovered_devices[device_id]
+    # Only a full scan vouches for the whole cache
+    if identifier is None:
+        scan_cache_expiry = time.monotonic() + SCAN_CACHE_TTL
+    
     return devices
 
 
+async def validate_device(device_id: str) -> bool:
+    """Check that a cached device still accepts connections on a service port"""
+    config = discovered_devices.get(device_id)
+    if config is None:
+        return False
+    
+    for service in config.services:
+        if not service.port:
+            continue
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(str(config.address), service.port),
+                timeout=VALIDATE_TIMEOUT,
+            )
+        except (OSError, asyncio.TimeoutError):
+            continue
+        writer.close()
+        return True
+    return False
+
+
+async def _connect(device_id: str) -> pyatv.interface.AppleTV:
+    """Find a device (scanning if needed) and open a new connection to it"""
+    # Only rescan if the device is unknown, or its cache entry has expired and
+    # the device no longer answers at the cached address
+    if device_id not in discovered_devices or (
+        time.monotonic() > scan_cache_expiry and not await validate_device(device_id)
+    ):
+        await scan_apple_tvs(identifier=device_id)
+    
+    if device_id not in discovered_devices:
+        raise HTTPException(status_code=404, detail=f"Apple TV {device_id} not found")
+    
+    config = discovered_devices[device_id]
+    
+    # Connect to the device
+    logger.info("Connecting to Apple TV: %s", config.name)
+    try:
+        atv = await pyatv.connect(config, asyncio.get_running_loop())
+        # Resolve remote control methods once per connection rather than per command
+        remote = atv.remote_control
+        atv._cmd_cache = {name: getattr(remote, name, None) for name in COMMAND_NAMES}
+        # Track liveness from pyatv's own events instead of probing per request.
+        # pyatv only holds a weak reference to the listener, so the connection
+        # keeps the strong one.
+        atv._is_closed = False
+        atv._connection_listener = ConnectionListener(device_id, atv)
+        atv.listener = atv._connection_listener
+        atv._feature_cache = {
+            feature: atv.features.in_state(FeatureState.Available, feature)
+            for feature in CACHED_FEATURES
+        }
+        logger.info("Connected to %s", config.name)
+        return atv
+    except Exception as e:
+        logger.error("Failed to connect to %s: %s", config.name, e)
+        raise HTTPException(status_code=500, detail=f"Failed to connect: {str(e)}")
+
+
+def spawn(coro) -> asyncio.Task:
+    """Run a coroutine in the background without waiting for it"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+
+def forget_connection(device_id: str):
+    """Drop the bookkeeping kept for a connection that was removed"""
+    connected_at.pop(device_id, None)
+    last_used.pop(device_id, None)
+    now_playing_cache.pop(device_id, None)
+    prune_device_lock(device_id)
+
+
+def prune_device_lock(device_id: str):
+    """Drop a device's lock once it has no connection or connection attempt"""
+    if device_id not in active_connections and device_id not in pending_connections:
+        device_locks.pop(device_id, None)
+
+
 async def get_or_create_connection(device_id: str) -> pyatv.interface.AppleTV:
     """Get existing connection or create a new one"""
-    async with connection_lock:
+    stale = None
+    async with device_locks[device_id]:
         # Check if we already have an active connection
         if device_id in active_connections:
             atv = active_connections[device_id]
-            # Verify connection is still alive
-            try:
-                # Try to access a property to verify connection
-                _ = atv.device_info
+            # Reuse it unless pyatv has reported it lost or closed
+            if not atv._is_closed:
+                active_connections.move_to_end(device_id)
+                last_used[device_id] = time.monotonic()
                 return atv
-            except Exception:
-                # Connection is stale, remove it
-                logger.warning(f"Stale connection for {device_id}, reconnecting...")
-                try:
-                    atv.close()
-                except Exception:
-                    pass
-                del active_connections[device_id]
-        
-        # Get device config from cache
-        if device_id not in discovered_devices:
-            # Rescan to find the device
-            devices = await scan_apple_tvs()
-            for device in devices:
-                discovered_devices[device.identifier] = device
-        
-        if device_id not in discovered_devices:
-            raise HTTPException(status_code=404, detail=f"Apple TV {device_id} not found")
-        
-        config = discovered_devices[device_id]
+            
+            # Connection is stale, remove it
+            logger.warning("Stale connection for %s, reconnecting...", device_id)
+            stale = active_connections.pop(device_id)
+            forget_connection(device_id)
         
-        # Connect to the device
-        logger.info(f"Connecting to Apple TV: {config.name}")
-        try:
-            atv = await pyatv.connect(config, asyncio.get_event_loop())
-            active_connections[device_id] = atv
-            logger.info(f"Connected to {config.name}")
-            return atv
-        except Exception as e:
-            logger.error(f"Failed to connect to {config.name}: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to connect: {str(e)}")
+        # Join an in-flight attempt for this device, or start one. It runs in
+        # its own task so a cancelled caller can't abort an attempt others share.
+        pending = pending_connections.get(device_id)
+        if pending is None:
+            pending = pending_connections[device_id] = spawn(establish_connection(device_id))
+            # Mark any failure as retrieved; every caller may have gone away
+            pending.add_done_callback(lambda task: task.cancelled() or task.exception())
+    
+    if stale is not None:
+        spawn(close_connection(device_id, stale))
+    
+    # Shield so a cancelled caller doesn't cancel the attempt for everyone else
+    return await asyncio.shield(pending)
+
+
+async def establish_connection(device_id: str) -> pyatv.interface.AppleTV:
+    """Connect to a device and register the connection (runs as a shared task)"""
+    # Scan and connect outside the lock so other devices aren't blocked
+    try:
+        atv = await _connect(device_id)
+    except BaseException:
+        async with device_locks[device_id]:
+            pending_connections.pop(device_id, None)
+            prune_device_lock(device_id)
+        raise
+    
+    async with device_locks[device_id]:
+        active_connections[device_id] = atv
+        connected_at[device_id] = last_used[device_id] = time.monotonic()
+        pending_connections.pop(device_id, None)
+        if now_playing_subscribers.get(device_id):
+            # Must not raise here: the connection is already registered
+            try:
+                start_push_updates(device_id, atv)
+            except Exception as e:
+                logger.error("Failed to restart push updates for %s: %s", device_id, e)
+    
+    # Evict the least recently used connections beyond the limit, preferring
+    # ones no WebSocket client is streaming from
+    while len(active_connections) > MAX_CONNECTIONS:
+        evicted_id = next(
+            (
+                candidate for candidate in active_connections
+                if candidate != device_id and not now_playing_subscribers.get(candidate)
+            ),
+            next(iter(active_connections)),
+        )
+        evicted = active_connections.pop(evicted_id)
+        forget_connection(evicted_id)
+        logger.info("Evicting least recently used connection to %s", evicted_id)
+        if now_playing_subscribers.get(evicted_id):
+            spawn(end_push_stream(evicted_id))
+        spawn(close_connection(evicted_id, evicted))
+    
+    return atv
+
+
+async def close_connection(device_id: str, atv: pyatv.interface.AppleTV):
+    """Close a connection and wait (bounded) for its teardown to finish"""
+    try:
+        tasks = atv.close()
+        if tasks:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout=CLOSE_TIMEOUT)
+        logger.info("Closed connection to %s", device_id)
+    except asyncio.TimeoutError:
+        logger.warning("Timed out closing connection to %s", device_id)
+    except Exception as e:
+        logger.warning("Error closing connection to %s: %s", device_id, e)
 
 
 async def close_all_connections():
     """Close all active Apple TV connections"""
-    async with connection_lock:
-        for device_id, atv in active_connections.items():
+    async def close_one(device_id: str, atv: pyatv.interface.AppleTV):
+        async with device_locks[device_id]:
+            if active_connections.get(device_id) is atv:
+                del active_connections[device_id]
+                forget_connection(device_id)
+        await close_connection(device_id, atv)
+    
+    # Snapshot first; each close is bounded by CLOSE_TIMEOUT, so shutdown takes
+    # at most that long no matter how many devices are connected
+    snapshot = list(active_connections.items())
+    await asyncio.gather(
+        *[close_one(device_id, atv) for device_id, atv in snapshot],
+        return_exceptions=True,
+    )
+
+
+async def close_connection_later(device_id: str, atv: pyatv.interface.AppleTV):
+    """Close a replaced connection once commands still running on it had time to finish"""
+    await asyncio.sleep(RECYCLE_GRACE_PERIOD)
+    await close_connection(device_id, atv)
+
+
+async def refresh_connection(device_id: str, old: pyatv.interface.AppleTV):
+    """Open a fresh connection and swap it in for old, keeping old usable meanwhile"""
+    try:
+        atv = await _connect(device_id)
+    except HTTPException as e:
+        logger.warning("Background reconnect to %s failed: %s", device_id, e.detail)
+        return
+    
+    async with device_locks[device_id]:
+        # Only replace the connection we set out to replace; if it was removed
+        # or already replaced by a request meanwhile, ours isn't needed
+        swapped = active_connections.get(device_id) is old
+        if swapped:
+            active_connections[device_id] = atv
+            connected_at[device_id] = time.monotonic()
+            if now_playing_subscribers.get(device_id):
+                try:
+                    start_push_updates(device_id, atv)
+                except Exception as e:
+                    logger.error("Failed to restart push updates for %s: %s", device_id, e)
+    
+    if not swapped:
+        await close_connection(device_id, atv)
+    elif old._is_closed:
+        await close_connection(device_id, old)
+    else:
+        spawn(close_connection_later(device_id, old))
+
+
+async def connection_keepalive_loop():
+    """Close idle connections, and reconnect stale or old ones in the background"""
+    while True:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        now = time.monotonic()
+        for device_id, atv in list(active_connections.items()):
             try:
-                atv.close()
-                logger.info(f"Closed connection to {device_id}")
+                async with device_locks[device_id]:
+                    if active_connections.get(device_id) is not atv:
+                        continue
+                    # Connections streaming to WebSocket subscribers are in use
+                    idle = (
+                        now - last_used.get(device_id, now) > CONNECTION_IDLE_TIMEOUT
+                        and not now_playing_subscribers.get(device_id)
+                    )
+                    if idle:
+                        del active_connections[device_id]
+                        forget_connection(device_id)
+                    alive = not atv._is_closed
+                
+                if idle:
+                    logger.info("Closing idle connection to %s", device_id)
+                    await close_connection(device_id, atv)
+                    continue
+                
+                if not alive:
+                    logger.warning("Connection to %s is stale, reconnecting in background", device_id)
+                elif now - connected_at.get(device_id, now) > CONNECTION_MAX_AGE:
+                    logger.info("Recycling connection to %s", device_id)
+                else:
+                    continue
+                await refresh_connection(device_id, atv)
             except Exception as e:
-                logger.warning(f"Error closing connection to {device_id}: {e}")
-        active_connections.clear()
+                logger.warning("Keep-alive for %s failed: %s", device_id, e)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan - handle startup and shutdown"""
-    # Startup: scan for devices
-    logger.info("Starting Apple TV Control Service...")
+def etag_response(request: Request, payload) -> Response:
+    """Return payload as JSON with an ETag, or 304 if the client already has it"""
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+async def initial_scan():
+    """Populate the device cache at startup"""
     try:
         devices = await scan_apple_tvs()
         for device in devices:
-            discovered_devices[device.identifier] = device
-            logger.info(f"  Found: {device.name} ({device.identifier})")
+            logger.info("  Found: %s (%s)", device.name, device.identifier)
     except Exception as e:
-        logger.warning(f"Initial scan failed: {e}")
+        logger.warning("Initial scan failed: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan - handle startup and shutdown"""
+    # Startup: scan for devices in the background so requests are served right
+    # away. /devices is empty until the scan finishes; /devices/scan joins it.
+    logger.info("Starting Apple TV Control Service...")
+    scan_task = asyncio.create_task(initial_scan())
+    keepalive_task = asyncio.create_task(connection_keepalive_loop())
     
     yield
     
-    # Shutdown: close all connections
+    # Shutdown: stop background work and close all connections
     logger.info("Shutting down Apple TV Control Service...")
+    scan_task.cancel()
+    keepalive_task.cancel()
+    shared_scans = list(scan_tasks.values())
+    for task in shared_scans:
+        task.cancel()
+    # Wait for them to stop so nothing reconnects a device while we close it
+    await asyncio.gather(scan_task, keepalive_task, *shared_scans, return_exceptions=True)
     await close_all_connections()
 
 
@@ -181,7 +592,7 @@ app.add_middleware(
 # ============================================================================
 
 @app.get("/devices", response_model=list[DeviceInfo])
-async def list_devices():
+async def list_devices(request: Request):
     """List all discovered Apple TV devices"""
     devices = []
     for device_id, config in discovered_devices.items():
@@ -190,22 +601,18 @@ async def list_devices():
             name=config.name,
             address=str(config.address),
             is_connected=device_id in active_connections,
-        ))
-    return devices
+        ).model_dump())
+    return etag_response(request, devices)
 
 
 @app.post("/devices/scan", response_model=list[DeviceInfo])
 async def rescan_devices():
     """Rescan the network for Apple TV devices"""
-    global discovered_devices
-    
     try:
         devices = await scan_apple_tvs()
-        discovered_devices.clear()
         
         result = []
         for device in devices:
-            discovered_devices[device.identifier] = device
             result.append(DeviceInfo(
                 id=device.identifier,
                 name=device.name,
@@ -214,7 +621,7 @@ async def rescan_devices():
             ))
         return result
     except Exception as e:
-        logger.error(f"Scan failed: {e}")
+        logger.error("Scan failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Scan failed: {str(e)}")
 
 
@@ -269,7 +676,7 @@ async def start_pairing(device_id: str, protocol: str = "companion"):
     
     try:
         # Use Companion protocol for full remote control
-        pairing = await pyatv.pair(config, proto, asyncio.get_event_loop())
+        pairing = await pyatv.pair(config, proto, asyncio.get_running_loop())
         await pairing.begin()
         
         # Store pairing session for later completion
@@ -282,7 +689,7 @@ async def start_pairing(device_id: str, protocol: str = "companion"):
             "requires_pin": True
         }
     except Exception as e:
-        logger.error(f"Failed to start pairing: {e}")
+        logger.error("Failed to start pairing: %s", e)
         raise HTTPException(status_code=500, detail=f"Pairing failed: {str(e)}")
 
 
@@ -303,7 +710,7 @@ async def finish_pairing(device_id: str, request: PairingRequest):
         # Store credentials
         if pairing.has_paired:
             credentials = pairing.service.credentials
-            logger.info(f"Pairing successful! Credentials: {credentials}")
+            logger.info("Pairing successful! Credentials: %s", credentials)
             
             # Clean up
             del pairing_sessions[device_id]
@@ -312,7 +719,7 @@ async def finish_pairing(device_id: str, request: PairingRequest):
         else:
             raise HTTPException(status_code=400, detail="Pairing not completed")
     except Exception as e:
-        logger.error(f"Failed to finish pairing: {e}")
+        logger.error("Failed to finish pairing: %s", e)
         raise HTTPException(status_code=500, detail=f"Pairing failed: {str(e)}")
 
 
@@ -320,7 +727,22 @@ async def finish_pairing(device_id: str, request: PairingRequest):
 # Remote Control Commands
 # ============================================================================
 
-@app.post("/devices/{device_id}/remote/{command}")
+class RemoteCommandConvertor(Convertor):
+    """Path convertor that only matches known remote control commands"""
+    regex = "|".join(sorted(COMMAND_NAMES))
+    
+    def convert(self, value: str) -> str:
+        return value
+    
+    def to_string(self, value: str) -> str:
+        return value
+
+
+register_url_convertor("remote_command", RemoteCommandConvertor())
+
+
+# Unknown commands don't match the route at all and get a 404 from the router
+@app.post("/devices/{device_id}/remote/{command:remote_command}", response_model=CommandResult)
 async def send_remote_command(device_id: str, command: str):
     """
     Send a remote control command to the Apple TV
@@ -332,45 +754,7 @@ async def send_remote_command(device_id: str, command: str):
     - Other: skip_forward, skip_backward
     """
     atv = await get_or_create_connection(device_id)
-    remote = atv.remote_control
-    
-    # Map command strings to remote control method names
-    # We use getattr to safely get methods that may or may not exist
-    command_names = {
-        # Navigation
-        "up": "up",
-        "down": "down",
-        "left": "left",
-        "right": "right",
-        "select": "select",
-        "menu": "menu",
-        "home": "home",
-        "top_menu": "top_menu",
-        
-        # Playback
-        "play": "play",
-        "pause": "pause",
-        "play_pause": "play_pause",
-        "stop": "stop",
-        "next": "next",
-        "previous": "previous",
-        "skip_forward": "skip_forward",
-        "skip_backward": "skip_backward",
-        
-        # Volume
-        "volume_up": "volume_up",
-        "volume_down": "volume_down",
-    }
-    
-    if command not in command_names:
-        available = ", ".join(command_names.keys())
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Unknown command: {command}. Available: {available}"
-        )
-    
-    method_name = command_names[command]
-    method = getattr(remote, method_name, None)
+    method = atv._cmd_cache[command]
     
     if method is None:
         raise HTTPException(
@@ -378,11 +762,15 @@ async def send_remote_command(device_id: str, command: str):
             detail=f"Command '{command}' not supported by this Apple TV"
         )
     
+    # Hot path during navigation bursts: skip even the call unless debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("cmd=%s dev=%s", command, device_id)
+    
     try:
         await method()
         return {"success": True, "command": command}
     except Exception as e:
-        logger.error(f"Command {command} failed: {e}")
+        logger.error("Command %s failed: %s", command, e)
         raise HTTPException(status_code=500, detail=f"Command failed: {str(e)}")
 
 
@@ -390,48 +778,162 @@ async def send_remote_command(device_id: str, command: str):
 # Now Playing Information
 # ============================================================================
 
+def fill_playing(result: NowPlayingInfo, current: pyatv.interface.Playing):
+    """Copy metadata from a pyatv Playing object into a NowPlayingInfo"""
+    result.title = current.title
+    result.artist = current.artist
+    result.album = current.album
+    result.genre = current.genre
+    result.media_type = str(current.media_type) if current.media_type else None
+    result.device_state = str(current.device_state) if current.device_state else "unknown"
+    result.position = current.position
+    result.total_time = current.total_time
+    result.repeat = str(current.repeat) if current.repeat else None
+    result.shuffle = str(current.shuffle) if current.shuffle else None
+
+
+def fill_app(result: NowPlayingInfo, atv: pyatv.interface.AppleTV):
+    """Add info about the app playing media, if the device reports it"""
+    # Metadata.app is a plain property backed by state pyatv already holds
+    try:
+        if atv.features.in_state(FeatureState.Available, FeatureName.App):
+            app_info = atv.metadata.app
+            if app_info:
+                result.app_name = app_info.name
+                result.app_id = app_info.identifier
+    except Exception as e:
+        logger.warning("Could not get app info: %s", e)
+
+
+class NowPlayingListener(PushListener):
+    """Forwards push updates from an Apple TV to its WebSocket subscribers"""
+    
+    def __init__(self, device_id: str, atv: pyatv.interface.AppleTV):
+        self.device_id = device_id
+        self.atv = atv
+    
+    def playstatus_update(self, updater, playstatus: pyatv.interface.Playing) -> None:
+        result = NowPlayingInfo(device_id=self.device_id)
+        fill_playing(result, playstatus)
+        fill_app(result, self.atv)
+        
+        now_playing_cache[self.device_id] = result
+        spawn(broadcast_now_playing(self.device_id, result))
+    
+    def playstatus_error(self, updater, exception: Exception) -> None:
+        logger.warning("Push update error from %s: %s", self.device_id, exception)
+        # Cached state can no longer be trusted; pyatv retries on its own
+        now_playing_cache.pop(self.device_id, None)
+
+
+async def broadcast_now_playing(device_id: str, info: NowPlayingInfo):
+    """Send now playing state to every subscriber of a device"""
+    payload = info.model_dump()
+    for websocket in list(now_playing_subscribers.get(device_id, ())):
+        try:
+            await websocket.send_json(payload)
+        except Exception:
+            # The last subscriber may have left (and removed the entry) meanwhile
+            now_playing_subscribers.get(device_id, set()).discard(websocket)
+
+
+def start_push_updates(device_id: str, atv: pyatv.interface.AppleTV):
+    """Start forwarding push updates from a connection"""
+    listener = NowPlayingListener(device_id, atv)
+    push_listeners[device_id] = listener
+    atv.push_updater.listener = listener
+    atv.push_updater.start()
+
+
+def stop_push_updates(device_id: str):
+    """Stop forwarding push updates and drop the cached state"""
+    listener = push_listeners.pop(device_id, None)
+    now_playing_cache.pop(device_id, None)
+    if listener is not None:
+        try:
+            listener.atv.push_updater.stop()
+        except Exception:
+            pass
+
+
+async def end_push_stream(device_id: str):
+    """Stop push updates for a device and close its WebSocket subscribers"""
+    stop_push_updates(device_id)
+    for websocket in now_playing_subscribers.pop(device_id, set()):
+        try:
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR, reason="Connection closed")
+        except Exception:
+            pass
+
+
+@app.websocket("/devices/{device_id}/now_playing/ws")
+async def now_playing_ws(websocket: WebSocket, device_id: str):
+    """Stream now playing information as the Apple TV pushes changes"""
+    # Accept first: closing before the handshake completes becomes a bare 403,
+    # and the client would never see the close code or reason
+    await websocket.accept()
+    
+    try:
+        atv = await get_or_create_connection(device_id)
+    except HTTPException as e:
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR, reason=e.detail)
+        return
+    
+    # The push updater runs only while at least one client is subscribed
+    subscribers = now_playing_subscribers.setdefault(device_id, set())
+    if not subscribers:
+        try:
+            start_push_updates(device_id, atv)
+        except Exception as e:
+            logger.error("Failed to start push updates for %s: %s", device_id, e)
+            push_listeners.pop(device_id, None)
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR, reason="Push updates not supported")
+            return
+    subscribers.add(websocket)
+    
+    try:
+        if device_id in now_playing_cache:
+            await websocket.send_json(now_playing_cache[device_id].model_dump())
+        # Nothing is expected from the client; this just waits for it to disconnect
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscribers.discard(websocket)
+        # The set may already have been removed by end_push_stream, and a new
+        # one created by later subscribers; leave that one alone
+        if not subscribers and now_playing_subscribers.get(device_id) is subscribers:
+            now_playing_subscribers.pop(device_id, None)
+            stop_push_updates(device_id)
+
+
 @app.get("/devices/{device_id}/now_playing", response_model=NowPlayingInfo)
-async def get_now_playing(device_id: str):
+async def get_now_playing(device_id: str, request: Request):
     """Get current now playing information from the Apple TV"""
+    # Serve the last pushed state while a WebSocket subscription keeps it fresh
+    if device_id in now_playing_cache:
+        return etag_response(request, now_playing_cache[device_id].model_dump())
+    
     atv = await get_or_create_connection(device_id)
     
     try:
-        playing = atv.metadata
-        push_updater = atv.push_updater
-        
         # Get current playing info
         result = NowPlayingInfo(device_id=device_id)
         
-        # Get basic metadata
+        # Get basic metadata; this is the only call that goes to the device
         try:
-            current = await playing.playing()
-            
-            result.title = current.title
-            result.artist = current.artist
-            result.album = current.album
-            result.genre = current.genre
-            result.media_type = str(current.media_type) if current.media_type else None
-            result.device_state = str(current.device_state) if current.device_state else "unknown"
-            result.position = current.position
-            result.total_time = current.total_time
-            result.repeat = str(current.repeat) if current.repeat else None
-            result.shuffle = str(current.shuffle) if current.shuffle else None
+            current = await atv.metadata.playing()
+            fill_playing(result, current)
         except Exception as e:
-            logger.warning(f"Could not get playing info: {e}")
+            logger.warning("Could not get playing info: %s", e)
         
         # Get app info if available
-        try:
-            if atv.features.in_state(FeatureState.Available, FeatureName.App):
-                app_info = await playing.app()
-                if app_info:
-                    result.app_name = app_info.name
-                    result.app_id = app_info.identifier
-        except Exception as e:
-            logger.warning(f"Could not get app info: {e}")
+        fill_app(result, atv)
         
-        return result
+        return etag_response(request, result.model_dump())
     except Exception as e:
-        logger.error(f"Failed to get now playing: {e}")
+        logger.error("Failed to get now playing: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get now playing: {str(e)}")
 
 
@@ -439,13 +941,13 @@ async def get_now_playing(device_id: str):
 # App Launching
 # ============================================================================
 
-@app.post("/devices/{device_id}/apps/{app_id}/launch")
+@app.post("/devices/{device_id}/apps/{app_id}/launch", response_model=AppLaunchResult)
 async def launch_app(device_id: str, app_id: str):
     """Launch an app on the Apple TV by its bundle ID"""
     atv = await get_or_create_connection(device_id)
     
     try:
-        if not atv.features.in_state(FeatureState.Available, FeatureName.LaunchApp):
+        if not atv._feature_cache[FeatureName.LaunchApp]:
             raise HTTPException(status_code=400, detail="App launching not supported")
         
         await atv.apps.launch_app(app_id)
@@ -453,23 +955,23 @@ async def launch_app(device_id: str, app_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to launch app {app_id}: {e}")
+        logger.error("Failed to launch app %s: %s", app_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to launch app: {str(e)}")
 
 
-@app.get("/devices/{device_id}/apps")
+@app.get("/devices/{device_id}/apps", response_model=AppList, response_model_exclude_none=True)
 async def list_apps(device_id: str):
     """List available apps on the Apple TV"""
     atv = await get_or_create_connection(device_id)
     
     try:
-        if not atv.features.in_state(FeatureState.Available, FeatureName.AppList):
+        if not atv._feature_cache[FeatureName.AppList]:
             return {"apps": [], "message": "App listing not supported on this device"}
         
         apps = await atv.apps.app_list()
         return {"apps": [{"id": app.identifier, "name": app.name} for app in apps]}
     except Exception as e:
-        logger.error(f"Failed to list apps: {e}")
+        logger.error("Failed to list apps: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to list apps: {str(e)}")
 
 
@@ -477,7 +979,7 @@ async def list_apps(device_id: str):
 # Connection Management
 # ============================================================================
 
-@app.post("/devices/{device_id}/connect")
+@app.post("/devices/{device_id}/connect", response_model=ConnectResult)
 async def connect_device(device_id: str):
     """Explicitly connect to an Apple TV"""
     atv = await get_or_create_connection(device_id)
@@ -488,25 +990,25 @@ async def connect_device(device_id: str):
     }
 
 
-@app.post("/devices/{device_id}/disconnect")
+@app.post("/devices/{device_id}/disconnect", response_model=DisconnectResult)
 async def disconnect_device(device_id: str):
     """Disconnect from an Apple TV"""
-    async with connection_lock:
-        if device_id in active_connections:
-            try:
-                active_connections[device_id].close()
-            except Exception:
-                pass
-            del active_connections[device_id]
-            return {"success": True, "message": f"Disconnected from {device_id}"}
+    async with device_locks[device_id]:
+        atv = active_connections.pop(device_id, None)
+        forget_connection(device_id)
+    if atv is None:
         return {"success": True, "message": "Device was not connected"}
+    if now_playing_subscribers.get(device_id):
+        await end_push_stream(device_id)
+    await close_connection(device_id, atv)
+    return {"success": True, "message": f"Disconnected from {device_id}"}
 
 
 # ============================================================================
 # Health Check
 # ============================================================================
 
-@app.get("/health")
+@app.get("/health", response_model=HealthStatus)
 async def health_check():
     """Health check endpoint"""
     return {
@@ -518,4 +1020,14 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        # Access logs are pure overhead during rapid remote-control bursts
+        access_log=False,
+        # Let the browser reuse one connection across button presses
+        timeout_keep_alive=75,
+    )
@@ -35,12 +35,19 @@ async function proxyRequest(
   const targetUrl = `${PYATV_SERVICE_URL}/${path}${queryString ? `?${queryString}` : ''}`;
   
   try {
+    const headers: Record<string, string> = {
+      "Content-Type": "application/json",
+      "Accept": "application/json",
+    };
+    // Forward conditional GETs so unchanged state comes back as a 304
+    const ifNoneMatch = request.headers.get("if-none-match");
+    if (ifNoneMatch) {
+      headers["If-None-Match"] = ifNoneMatch;
+    }
+    
     const fetchOptions: RequestInit = {
       method,
-      headers: {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-      },
+      headers,
       cache: 'no-store',
     };
     
@@ -56,11 +63,18 @@ async function proxyRequest(
     
     const response = await fetch(targetUrl, fetchOptions);
     
+    const etag = response.headers.get("etag");
+    const responseHeaders: Record<string, string> = etag ? { ETag: etag } : {};
+    
+    if (response.status === 304) {
+      return new NextResponse(null, { status: 304, headers: responseHeaders });
+    }
+    
     // Handle non-JSON responses
     const contentType = response.headers.get("content-type");
     if (contentType && contentType.includes("application/json")) {
       const data = await response.json();
-      return NextResponse.json(data, { status: response.status });
+      return NextResponse.json(data, { status: response.status, headers: responseHeaders });
     }
     
     // Return text response